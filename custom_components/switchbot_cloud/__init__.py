@@ -2,20 +2,37 @@
 
 from asyncio import gather
 from dataclasses import dataclass, field
+from functools import partial
 from logging import getLogger
+import time
+from typing import Any
 
 from homeassistant.config_entries import ConfigEntry
 from homeassistant.const import CONF_API_KEY, CONF_API_TOKEN, Platform
 from homeassistant.core import HomeAssistant, callback
 from homeassistant.exceptions import ConfigEntryNotReady
-from switchbot_api import CannotConnect, Device, InvalidAuth, Remote, SwitchBotAPI
+import homeassistant.helpers.config_validation as cv
+from homeassistant.helpers.storage import Store
+from homeassistant.helpers.typing import ConfigType
+from switchbot_api import (
+    CannotConnect,
+    Device,
+    DeviceOffline,
+    InvalidAuth,
+    Remote,
+    SwitchBotAPI,
+)
 
-from .const import DOMAIN
-from .coordinator import SwitchBotCoordinator
+from .const import DOMAIN, QUOTA_STORAGE_VERSION
+from .coordinator import SwitchBotCoordinator, SwitchBotHubCoordinator
+from .profiler import async_get_profiler, async_setup_services
+from .scheduler import ApiScheduler, RequestPriority
 
 _LOGGER = getLogger(__name__)
+CONFIG_SCHEMA = cv.config_entry_only_config_schema(DOMAIN)
 PLATFORMS: list[Platform] = [
     Platform.CLIMATE,
+    Platform.SCENE,
     Platform.SENSOR,
     Platform.SWITCH,
     Platform.VACUUM,
@@ -32,12 +49,49 @@ class SwitchbotDevices:
     vacuums: list[Device] = field(default_factory=list)
 
 
+@dataclass
+class SwitchbotScene:
+    """Switchbot manual scene."""
+
+    scene_id: str
+    scene_name: str
+
+
 @dataclass
 class SwitchbotCloudData:
     """Data to use in platforms."""
 
     api: SwitchBotAPI
     devices: SwitchbotDevices
+    scheduler: ApiScheduler
+    scenes: list[SwitchbotScene] = field(default_factory=list)
+
+
+async def _async_scenes_request(
+    api: SwitchBotAPI, path: str, method: str = "get"
+) -> Any:
+    """Send a request to the scenes endpoints.
+
+    switchbot-api==2.2.1 has no scene methods, so this is the only place that
+    relies on its private SwitchBotAPI._request(path, callback=<aiohttp method>).
+    Revisit it whenever the pin in manifest.json changes.
+    """
+    # https://github.com/OpenWonderLabs/SwitchBotAPI?tab=readme-ov-file#scenes
+    return await api._request(f"scenes{path}", callback=method)
+
+
+async def async_list_scenes(api: SwitchBotAPI) -> list[SwitchbotScene]:
+    """List manual scenes."""
+    body = await _async_scenes_request(api, "")
+    return [
+        SwitchbotScene(scene_id=scene["sceneId"], scene_name=scene["sceneName"])
+        for scene in body or []
+    ]
+
+
+async def async_execute_scene(api: SwitchBotAPI, scene_id: str) -> None:
+    """Execute a manual scene."""
+    await _async_scenes_request(api, f"/{scene_id}/execute", "post")
 
 
 @callback
@@ -46,12 +100,15 @@ def prepare_device(
     api: SwitchBotAPI,
     device: Device | Remote,
     coordinators_by_id: dict[str, SwitchBotCoordinator],
+    scheduler: ApiScheduler,
+    hubs_by_id: dict[str, SwitchBotHubCoordinator],
 ) -> tuple[Device | Remote, SwitchBotCoordinator]:
     """Instantiate coordinator and adds to list for gathering."""
-    coordinator = coordinators_by_id.setdefault(
-        device.device_id, SwitchBotCoordinator(hass, api, device)
-    )
-    return (device, coordinator)
+    if device.device_id not in coordinators_by_id:
+        coordinators_by_id[device.device_id] = SwitchBotCoordinator(
+            hass, api, device, scheduler, hubs_by_id.get(device.hub_device_id)
+        )
+    return (device, coordinators_by_id[device.device_id])
 
 
 @callback
@@ -60,15 +117,28 @@ def make_device_data(
     api: SwitchBotAPI,
     devices: list[Device | Remote],
     coordinators_by_id: dict[str, SwitchBotCoordinator],
+    scheduler: ApiScheduler,
+    hubs_by_id: dict[str, SwitchBotHubCoordinator],
 ) -> SwitchbotDevices:
     """Make device data."""
     devices_data = SwitchbotDevices()
+    device_ids = {device.device_id for device in devices}
+    for device in devices:
+        hub_id = device.hub_device_id
+        if (
+            hub_id in device_ids
+            and hub_id != device.device_id
+            and hub_id not in hubs_by_id
+        ):
+            hubs_by_id[hub_id] = SwitchBotHubCoordinator(hass, api, hub_id, scheduler)
     for device in devices:
         if isinstance(device, Remote) and device.device_type.endswith(
             "Air Conditioner"
         ):
             devices_data.climates.append(
-                prepare_device(hass, api, device, coordinators_by_id)
+                prepare_device(
+                    hass, api, device, coordinators_by_id, scheduler, hubs_by_id
+                )
             )
         if (
             isinstance(device, Device)
@@ -76,15 +146,21 @@ def make_device_data(
             or isinstance(device, Remote)
         ):
             devices_data.switches.append(
-                prepare_device(hass, api, device, coordinators_by_id)
+                prepare_device(
+                    hass, api, device, coordinators_by_id, scheduler, hubs_by_id
+                )
             )
         if isinstance(device, Device) and device.device_type in [
             "Meter",
             "MeterPlus",
             "WoIOSensor",
+            "Plug Mini (US)",
+            "Plug Mini (JP)",
         ]:
             devices_data.sensors.append(
-                prepare_device(hass, api, device, coordinators_by_id)
+                prepare_device(
+                    hass, api, device, coordinators_by_id, scheduler, hubs_by_id
+                )
             )
         if isinstance(device, Device) and device.device_type in [
             "Robot Vacuum Cleaner S10",
@@ -94,20 +170,41 @@ def make_device_data(
             "Robot Vacuum Cleaner S1 Plus",
         ]:
             devices_data.vacuums.append(
-                prepare_device(hass, api, device, coordinators_by_id)
+                prepare_device(
+                    hass, api, device, coordinators_by_id, scheduler, hubs_by_id
+                )
+            )
+            devices_data.sensors.append(
+                prepare_device(
+                    hass, api, device, coordinators_by_id, scheduler, hubs_by_id
+                )
             )
 
     return devices_data
 
 
+@callback
+def _quota_store(hass: HomeAssistant, entry: ConfigEntry) -> Store[dict[str, Any]]:
+    """Return the store persisting the daily request count of an entry."""
+    return Store(hass, QUOTA_STORAGE_VERSION, f"{DOMAIN}.{entry.entry_id}.quota")
+
+
+async def async_setup(hass: HomeAssistant, config: ConfigType) -> bool:
+    """Set up the SwitchBot via API services."""
+    async_setup_services(hass)
+    return True
+
+
 async def async_setup_entry(hass: HomeAssistant, config: ConfigEntry) -> bool:
     """Set up SwitchBot via API from a config entry."""
     token = config.data[CONF_API_TOKEN]
     secret = config.data[CONF_API_KEY]
 
     api = SwitchBotAPI(token=token, secret=secret)
+    scheduler = ApiScheduler(_quota_store(hass, config))
+    await scheduler.async_load()
     try:
-        devices = await api.list_devices()
+        devices = await scheduler.async_run(RequestPriority.COMMAND, api.list_devices)
     except InvalidAuth as ex:
         _LOGGER.exception(
             "Invalid authentication while connecting to SwitchBot API: %s", ex,
@@ -116,11 +213,34 @@ async def async_setup_entry(hass: HomeAssistant, config: ConfigEntry) -> bool:
     except CannotConnect as ex:
         raise ConfigEntryNotReady from ex
     _LOGGER.debug("Devices: %s", devices)
+    # Scenes are optional, failing to list them must not block the devices.
+    try:
+        scenes = await scheduler.async_run(
+            RequestPriority.COMMAND, partial(async_list_scenes, api)
+        )
+    except (CannotConnect, InvalidAuth, DeviceOffline) as ex:
+        _LOGGER.warning("Unable to list SwitchBot scenes: %s", ex)
+        scenes = []
+    _LOGGER.debug("Scenes: %s", scenes)
     coordinators_by_id: dict[str, SwitchBotCoordinator] = {}
+    hubs_by_id: dict[str, SwitchBotHubCoordinator] = {}
+    start = time.thread_time()
+    devices_data = make_device_data(
+        hass, api, devices, coordinators_by_id, scheduler, hubs_by_id
+    )
+    async_get_profiler(hass).record_setup(config.entry_id, time.thread_time() - start)
     hass.data.setdefault(DOMAIN, {})
     hass.data[DOMAIN][config.entry_id] = SwitchbotCloudData(
-        api=api, devices=make_device_data(hass, api, devices, coordinators_by_id)
+        api=api,
+        devices=devices_data,
+        scheduler=scheduler,
+        scenes=scenes,
     )
+    for coordinator in coordinators_by_id.values():
+        if (remove_listener := coordinator.async_track_hub()) is not None:
+            config.async_on_unload(remove_listener)
+    for hub in hubs_by_id.values():
+        config.async_on_unload(hub.async_shutdown)
     await hass.config_entries.async_forward_entry_setups(config, PLATFORMS)
     await gather(
         *[coordinator.async_refresh() for coordinator in coordinators_by_id.values()]
@@ -131,6 +251,13 @@ async def async_setup_entry(hass: HomeAssistant, config: ConfigEntry) -> bool:
 async def async_unload_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
     """Unload a config entry."""
     if unload_ok := await hass.config_entries.async_unload_platforms(entry, PLATFORMS):
-        hass.data[DOMAIN].pop(entry.entry_id)
+        data: SwitchbotCloudData = hass.data[DOMAIN].pop(entry.entry_id)
+        await data.scheduler.async_save()
+        async_get_profiler(hass).remove_setup(entry.entry_id)
 
     return unload_ok
+
+
+async def async_remove_entry(hass: HomeAssistant, entry: ConfigEntry) -> None:
+    """Remove the persisted request count of a removed config entry."""
+    await _quota_store(hass, entry).async_remove()
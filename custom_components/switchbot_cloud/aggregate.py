@@ -0,0 +1,156 @@
+"""Fleet-wide aggregates over SwitchBot Cloud device statuses."""
+
+from collections.abc import Iterable
+from heapq import heapify, heappop, heappush
+from numbers import Real
+
+from homeassistant.core import CALLBACK_TYPE, callback
+
+from .const import LOW_BATTERY_THRESHOLD, SENSOR_KIND_BATTERY
+from .coordinator import Status, SwitchBotCoordinator
+
+
+class RunningStatistic:
+    """Min, max and mean of one value per device, maintained incrementally.
+
+    Sum and count are adjusted in O(1) per update. Min and max use heaps with
+    lazy deletion: superseded entries are only discarded once they surface, and
+    the heaps are rebuilt in O(N) once stale entries outnumber live ones, so an
+    update costs amortized O(log N) for N reporting devices.
+    """
+
+    def __init__(self) -> None:
+        """Initialize an empty statistic."""
+        self._values: dict[str, float] = {}
+        self._sum = 0.0
+        self._min_heap: list[tuple[float, str]] = []
+        self._max_heap: list[tuple[float, str]] = []
+
+    @property
+    def count(self) -> int:
+        """Return the number of devices reporting a value."""
+        return len(self._values)
+
+    @property
+    def mean(self) -> float | None:
+        """Return the mean value, if any device reports one."""
+        if not self._values:
+            return None
+        return round(self._sum / len(self._values), 2)
+
+    @property
+    def minimum(self) -> float | None:
+        """Return the lowest value, if any device reports one."""
+        heap = self._min_heap
+        while heap and self._values.get(heap[0][1]) != heap[0][0]:
+            heappop(heap)
+        return heap[0][0] if heap else None
+
+    @property
+    def maximum(self) -> float | None:
+        """Return the highest value, if any device reports one."""
+        heap = self._max_heap
+        while heap and self._values.get(heap[0][1]) != -heap[0][0]:
+            heappop(heap)
+        return -heap[0][0] if heap else None
+
+    def update(self, device_id: str, value: float | None) -> None:
+        """Replace the value reported by a device."""
+        previous = self._values.pop(device_id, None)
+        if previous is not None:
+            self._sum -= previous
+        if value is not None:
+            self._values[device_id] = value
+            self._sum += value
+            if value != previous:
+                heappush(self._min_heap, (value, device_id))
+                heappush(self._max_heap, (-value, device_id))
+        if len(self._min_heap) > 2 * len(self._values) + 16:
+            self._compact()
+
+    def _compact(self) -> None:
+        """Drop superseded heap entries and resynchronize the sum."""
+        self._min_heap = [(value, device) for device, value in self._values.items()]
+        self._max_heap = [(-value, device) for device, value in self._values.items()]
+        heapify(self._min_heap)
+        heapify(self._max_heap)
+        self._sum = sum(self._values.values())
+
+
+class FleetAggregator:
+    """Aggregates the statuses of every polled device of a config entry.
+
+    Each coordinator update only applies the delta for its own device, costing
+    amortized O(log N) for the heap-backed min and max and O(1) for everything
+    else, instead of rescanning the whole fleet.
+    """
+
+    def __init__(self, keys: Iterable[str]) -> None:
+        """Initialize the aggregator for the given status keys."""
+        self._statistics = {key: RunningStatistic() for key in keys}
+        self._low_battery: set[str] = set()
+        self._offline: set[str] = set()
+        self._listeners: list[CALLBACK_TYPE] = []
+
+    @property
+    def low_battery_count(self) -> int:
+        """Return the number of devices with a low battery."""
+        return len(self._low_battery)
+
+    @property
+    def offline_count(self) -> int:
+        """Return the number of devices that are not reachable."""
+        return len(self._offline)
+
+    def statistic(self, key: str) -> RunningStatistic:
+        """Return the running statistic for a status key."""
+        return self._statistics[key]
+
+    @callback
+    def async_add_listener(self, update_callback: CALLBACK_TYPE) -> CALLBACK_TYPE:
+        """Listen for aggregate updates."""
+        self._listeners.append(update_callback)
+
+        @callback
+        def remove_listener() -> None:
+            """Remove update listener."""
+            self._listeners.remove(update_callback)
+
+        return remove_listener
+
+    @callback
+    def async_track(
+        self, device_id: str, coordinator: SwitchBotCoordinator
+    ) -> CALLBACK_TYPE:
+        """Feed the updates of a device coordinator into the aggregates."""
+
+        @callback
+        def _handle_coordinator_update() -> None:
+            self._async_update_device(
+                device_id,
+                coordinator.data if coordinator.last_update_success else None,
+            )
+
+        return coordinator.async_add_listener(_handle_coordinator_update)
+
+    @callback
+    def _async_update_device(self, device_id: str, status: Status) -> None:
+        """Apply the latest status of a single device."""
+        if status is None or status.get("onlineStatus") == "offline":
+            self._offline.add(device_id)
+            status = {}
+        else:
+            self._offline.discard(device_id)
+
+        for key, statistic in self._statistics.items():
+            value = status.get(key)
+            statistic.update(device_id, value if isinstance(value, Real) else None)
+
+        battery = status.get(SENSOR_KIND_BATTERY)
+        if isinstance(battery, Real) and battery < LOW_BATTERY_THRESHOLD:
+            self._low_battery.add(device_id)
+        else:
+            self._low_battery.discard(device_id)
+
+        for update_callback in self._listeners:
+            update_callback()
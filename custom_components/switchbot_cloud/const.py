@@ -7,6 +7,18 @@ DOMAIN: Final = "switchbot_cloud"
 ENTRY_TITLE = "SwitchBot Cloud"
 DEFAULT_SCAN_INTERVAL = timedelta(seconds=600)
 
+# https://github.com/OpenWonderLabs/SwitchBotAPI?tab=readme-ov-file#request-limit
+API_DAILY_QUOTA = 10000
+API_COMMAND_RESERVE = 500
+API_MAX_CONCURRENT_REQUESTS = 4
+API_BACKOFF_INITIAL = timedelta(seconds=60)
+API_BACKOFF_MAX = timedelta(minutes=30)
+QUOTA_STORAGE_VERSION = 1
+QUOTA_SAVE_DELAY = 30
+
+PROFILE_DEFAULT_SECONDS = 60.0
+PROFILE_DEFAULT_SLOW_CALLBACK_SECONDS = 0.01
+
 SENSOR_KIND_TEMPERATURE = "temperature"
 SENSOR_KIND_HUMIDITY = "humidity"
 SENSOR_KIND_BATTERY = "battery"
@@ -15,3 +27,5 @@ VACUUM_FAN_SPEED_QUIET = "quiet"
 VACUUM_FAN_SPEED_STANDARD = "standard"
 VACUUM_FAN_SPEED_STRONG = "strong"
 VACUUM_FAN_SPEED_MAX = "max"
+
+LOW_BATTERY_THRESHOLD = 20
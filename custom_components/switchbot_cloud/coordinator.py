@@ -1,29 +1,110 @@
 """SwitchBot Cloud coordinator."""
 
 from asyncio import timeout
+from collections.abc import Callable
 from logging import getLogger
+import time
 from typing import Any
 
-from switchbot_api import CannotConnect, Device, Remote, SwitchBotAPI
+from switchbot_api import CannotConnect, Device, DeviceOffline, Remote, SwitchBotAPI
 
-from homeassistant.core import HomeAssistant
+from homeassistant.core import CALLBACK_TYPE, HomeAssistant, callback
 from homeassistant.helpers.update_coordinator import DataUpdateCoordinator, UpdateFailed
 
 from .const import DEFAULT_SCAN_INTERVAL, DOMAIN
+from .profiler import async_get_profiler
+from .scheduler import ApiScheduler, PollShedError, RequestPriority
 
 _LOGGER = getLogger(__name__)
 
 type Status = dict[str, Any] | None
 
 
+class SwitchBotHubCoordinator(DataUpdateCoordinator[bool | None]):
+    """SwitchBot Cloud hub reachability coordinator.
+
+    The hub is only checked when one of its children reports being offline,
+    at most once per scan interval. Until a check confirms that it is online,
+    including when the check itself fails or is shed, that single check is
+    repeated every scan interval in place of polling each of its children.
+    """
+
+    _api: SwitchBotAPI
+    _hub_id: str
+    scheduler: ApiScheduler
+
+    def __init__(
+        self,
+        hass: HomeAssistant,
+        api: SwitchBotAPI,
+        hub_id: str,
+        scheduler: ApiScheduler,
+    ) -> None:
+        """Initialize SwitchBot Cloud hub."""
+        super().__init__(
+            hass,
+            _LOGGER,
+            name=DOMAIN,
+            update_interval=None,
+        )
+        self._api = api
+        self._hub_id = hub_id
+        self.scheduler = scheduler
+        self._checked_at: float | None = None
+
+    @property
+    def is_offline(self) -> bool:
+        """Return True if the last check found the hub offline."""
+        return self.data is False
+
+    @property
+    def checked_recently(self) -> bool:
+        """Return True if the hub was checked within the scan interval."""
+        return (
+            self._checked_at is not None
+            and time.monotonic() - self._checked_at
+            < DEFAULT_SCAN_INTERVAL.total_seconds()
+        )
+
+    async def _async_update_data(self) -> bool | None:
+        """Check whether the hub is reachable."""
+        self._checked_at = time.monotonic()
+        # Recheck on a schedule unless the hub is confirmed online below.
+        self.update_interval = DEFAULT_SCAN_INTERVAL
+        try:
+            _LOGGER.debug("Checking hub %s", self._hub_id)
+            await self.scheduler.async_run(RequestPriority.POLL, self._async_get_status)
+        except PollShedError:
+            return self.data
+        except DeviceOffline:
+            _LOGGER.debug("Hub %s is offline", self._hub_id)
+            return False
+        except CannotConnect as err:
+            msg = f"Error communicating with API: {err}"
+            raise UpdateFailed(msg) from err
+        self.update_interval = None
+        return True
+
+    async def _async_get_status(self) -> Status:
+        """Fetch the hub status, timing out only once a slot is granted."""
+        async with timeout(10):
+            return await self._api.get_status(self._hub_id)
+
+
 class SwitchBotCoordinator(DataUpdateCoordinator[Status]):
     """SwitchBot Cloud coordinator."""
 
     _api: SwitchBotAPI
     _device_id: str
+    scheduler: ApiScheduler
 
     def __init__(
-        self, hass: HomeAssistant, api: SwitchBotAPI, device: Device | Remote
+        self,
+        hass: HomeAssistant,
+        api: SwitchBotAPI,
+        device: Device | Remote,
+        scheduler: ApiScheduler,
+        hub: SwitchBotHubCoordinator | None = None,
     ) -> None:
         """Initialize SwitchBot Cloud."""
         super().__init__(
@@ -34,17 +115,94 @@ class SwitchBotCoordinator(DataUpdateCoordinator[Status]):
         )
         self._api = api
         self._device_id = device.device_id
+        self.scheduler = scheduler
         self._should_poll = not isinstance(device, Remote)
+        self._hub = hub
+        self._hub_offline = False
+        self._profiler = async_get_profiler(hass)
+
+    @callback
+    def async_add_listener(
+        self, update_callback: CALLBACK_TYPE, context: Any = None
+    ) -> Callable[[], None]:
+        """Listen for data updates, timing the listener while profiling."""
+        return super().async_add_listener(
+            self._profiler.wrap_listener(update_callback, self._device_id), context
+        )
+
+    @callback
+    def async_update_listeners(self) -> None:
+        """Update all registered listeners, timing the dispatch while profiling."""
+        if not self._profiler.active:
+            super().async_update_listeners()
+            return
+        start = time.thread_time()
+        super().async_update_listeners()
+        self._profiler.record_dispatch(time.thread_time() - start)
+
+    @callback
+    def async_track_hub(self) -> CALLBACK_TYPE | None:
+        """Follow the reachability of this device's hub, if it has one."""
+        if self._hub is None:
+            return None
+        return self._hub.async_add_listener(self._handle_hub_update)
+
+    @callback
+    def _async_refresh_in_background(
+        self, coordinator: DataUpdateCoordinator[Any], name: str
+    ) -> None:
+        """Request a refresh in a task cancelled when the entry unloads."""
+        assert self.config_entry is not None
+        self.config_entry.async_create_background_task(
+            self.hass, coordinator.async_request_refresh(), name
+        )
+
+    @callback
+    def _handle_hub_update(self) -> None:
+        """Suspend or resume this device when its hub goes offline or online."""
+        if self._hub is None or self._hub.is_offline == self._hub_offline:
+            return
+        self._hub_offline = self._hub.is_offline
+        if self._hub_offline:
+            self.async_set_update_error(
+                UpdateFailed(f"Hub of {self._device_id} is offline")
+            )
+        else:
+            self._async_refresh_in_background(
+                self, f"{DOMAIN} resume {self._device_id}"
+            )
 
     async def _async_update_data(self) -> Status:
         """Fetch data from API endpoint."""
+        if self._hub_offline:
+            msg = f"Hub of {self._device_id} is offline"
+            raise UpdateFailed(msg)
         if not self._should_poll:
             return None
         try:
             _LOGGER.debug("Refreshing %s", self._device_id)
-            async with timeout(10):
-                status: Status = await self._api.get_status(self._device_id)
-                _LOGGER.debug("Refreshing %s with %s", self._device_id, status)
-                return status
+            status: Status = await self.scheduler.async_run(
+                RequestPriority.POLL, self._async_get_status
+            )
+        except PollShedError:
+            _LOGGER.debug("Skipped refreshing %s to preserve quota", self._device_id)
+            return self.data
+        except DeviceOffline as err:
+            if self._hub is not None and not self._hub.checked_recently:
+                # Confirm with a single check whether the whole hub is gone.
+                self._async_refresh_in_background(
+                    self._hub, f"{DOMAIN} check hub of {self._device_id}"
+                )
+            msg = f"Device {self._device_id} is offline"
+            raise UpdateFailed(msg) from err
         except CannotConnect as err:
-            raise UpdateFailed(f"Error communicating with API: {err}") from err
+            msg = f"Error communicating with API: {err}"
+            raise UpdateFailed(msg) from err
+        else:
+            _LOGGER.debug("Refreshing %s with %s", self._device_id, status)
+            return status
+
+    async def _async_get_status(self) -> Status:
+        """Fetch the device status, timing out only once a slot is granted."""
+        async with timeout(10):
+            return await self._api.get_status(self._device_id)
@@ -1,5 +1,6 @@
 """Base class for SwitchBot via API entities."""
 
+from functools import partial
 from typing import Any
 
 from switchbot_api import Commands, Device, Remote, SwitchBotAPI
@@ -9,6 +10,7 @@ from homeassistant.helpers.update_coordinator import CoordinatorEntity
 
 from .const import DOMAIN
 from .coordinator import SwitchBotCoordinator
+from .scheduler import RequestPriority
 
 
 class SwitchBotCloudEntity(CoordinatorEntity[SwitchBotCoordinator]):
@@ -41,10 +43,14 @@ class SwitchBotCloudEntity(CoordinatorEntity[SwitchBotCoordinator]):
         command_type: str = "command",
         parameters: dict | str = "default",
     ) -> None:
-        """Send command to device."""
-        await self._api.send_command(
-            self._attr_unique_id,
-            command,
-            command_type,
-            parameters,
+        """Send command to device ahead of any queued background poll."""
+        await self.coordinator.scheduler.async_run(
+            RequestPriority.COMMAND,
+            partial(
+                self._api.send_command,
+                self._attr_unique_id,
+                command,
+                command_type,
+                parameters,
+            ),
         )
@@ -0,0 +1,230 @@
+"""Event loop profiling of the SwitchBot Cloud integration."""
+
+from asyncio import sleep
+from dataclasses import asdict, dataclass, field
+import json
+from logging import getLogger
+from pathlib import Path
+import time
+from typing import Any
+
+import voluptuous as vol
+
+from homeassistant.components import persistent_notification
+from homeassistant.core import CALLBACK_TYPE, HomeAssistant, ServiceCall, callback
+from homeassistant.exceptions import HomeAssistantError
+from homeassistant.helpers.entity import Entity
+from homeassistant.helpers.service import async_register_admin_service
+
+from .const import (
+    DOMAIN,
+    PROFILE_DEFAULT_SECONDS,
+    PROFILE_DEFAULT_SLOW_CALLBACK_SECONDS,
+)
+
+_LOGGER = getLogger(__name__)
+
+DATA_PROFILER = f"{DOMAIN}_profiler"
+
+SERVICE_PROFILE = "profile"
+CONF_SECONDS = "seconds"
+CONF_SLOW_CALLBACK_SECONDS = "slow_callback_seconds"
+
+PROFILE_SCHEMA = vol.Schema(
+    {
+        vol.Optional(CONF_SECONDS, default=PROFILE_DEFAULT_SECONDS): vol.All(
+            vol.Coerce(float), vol.Range(min=1, max=3600)
+        ),
+        vol.Optional(
+            CONF_SLOW_CALLBACK_SECONDS, default=PROFILE_DEFAULT_SLOW_CALLBACK_SECONDS
+        ): vol.All(vol.Coerce(float), vol.Range(min=0)),
+    }
+)
+
+
+@dataclass
+class CallbackStats:
+    """Time spent on the event loop by one kind of callback."""
+
+    calls: int = 0
+    total: float = 0.0
+    maximum: float = 0.0
+    slow: int = 0
+
+
+@dataclass
+class ProfileWindow:
+    """Callback timings collected while a profile is running."""
+
+    slow_callback_seconds: float
+    dispatch: CallbackStats = field(default_factory=CallbackStats)
+    platforms: dict[str, CallbackStats] = field(default_factory=dict)
+    entities: dict[str, CallbackStats] = field(default_factory=dict)
+
+    def record(self, stats: CallbackStats, elapsed: float) -> None:
+        """Add a callback run to its stats."""
+        stats.calls += 1
+        stats.total += elapsed
+        stats.maximum = max(stats.maximum, elapsed)
+        if elapsed >= self.slow_callback_seconds:
+            stats.slow += 1
+
+    def record_listener(
+        self, update_callback: CALLBACK_TYPE, label: str, elapsed: float
+    ) -> None:
+        """Attribute a coordinator listener run to its entity and platform.
+
+        Listeners that are not entity methods are keyed by their name and the
+        label they were wrapped with, so the same closure registered on
+        several coordinators gets one row per coordinator.
+        """
+        owner = getattr(update_callback, "__self__", None)
+        if isinstance(owner, Entity) and owner.entity_id:
+            name = owner.entity_id
+            platform = owner.platform.domain if owner.platform else "unknown"
+        else:
+            qualname = getattr(update_callback, "__qualname__", repr(update_callback))
+            name = f"{qualname} [{label}]"
+            platform = DOMAIN
+        self.record(self.entities.setdefault(name, CallbackStats()), elapsed)
+        self.record(self.platforms.setdefault(platform, CallbackStats()), elapsed)
+
+
+class LoopProfiler:
+    """Times the integration's hot paths on the event loop.
+
+    Timings are CPU time of the event loop thread, as measured by
+    time.thread_time(), so time the thread spends preempted or waiting on the
+    GIL is not blamed on the callback being timed. Outside of a profile window
+    the only overhead is a single attribute check per callback.
+    """
+
+    def __init__(self) -> None:
+        """Initialize the profiler."""
+        self._window: ProfileWindow | None = None
+        self.setup_durations: dict[str, float] = {}
+
+    @property
+    def active(self) -> bool:
+        """Return True while a profile window is open."""
+        return self._window is not None
+
+    def start(self, slow_callback_seconds: float) -> None:
+        """Open a profile window."""
+        if self._window is not None:
+            msg = "A SwitchBot Cloud profile is already running"
+            raise HomeAssistantError(msg)
+        self._window = ProfileWindow(slow_callback_seconds)
+
+    def stop(self) -> ProfileWindow:
+        """Close the profile window and return its timings."""
+        window, self._window = self._window, None
+        assert window is not None
+        return window
+
+    def record_setup(self, entry_id: str, elapsed: float) -> None:
+        """Record how long building the device data of an entry took."""
+        self.setup_durations[entry_id] = elapsed
+        _LOGGER.debug("Made device data for %s in %.3fs of CPU time", entry_id, elapsed)
+
+    def remove_setup(self, entry_id: str) -> None:
+        """Forget the setup duration of an unloaded entry."""
+        self.setup_durations.pop(entry_id, None)
+
+    def record_dispatch(self, elapsed: float) -> None:
+        """Record a coordinator dispatching an update to its listeners."""
+        if (window := self._window) is not None:
+            window.record(window.dispatch, elapsed)
+
+    def wrap_listener(
+        self, update_callback: CALLBACK_TYPE, label: str
+    ) -> CALLBACK_TYPE:
+        """Wrap a coordinator listener so its runs are timed while profiling."""
+
+        @callback
+        def _profiled_update_callback() -> None:
+            if (window := self._window) is None:
+                update_callback()
+                return
+            start = time.thread_time()
+            try:
+                update_callback()
+            finally:
+                window.record_listener(
+                    update_callback, label, time.thread_time() - start
+                )
+
+        return _profiled_update_callback
+
+
+@callback
+def async_get_profiler(hass: HomeAssistant) -> LoopProfiler:
+    """Return the profiler shared by all config entries."""
+    if (profiler := hass.data.get(DATA_PROFILER)) is None:
+        profiler = hass.data[DATA_PROFILER] = LoopProfiler()
+    return profiler
+
+
+def _write_report(path: str, report: dict[str, Any]) -> None:
+    """Write a profile report."""
+    with Path(path).open("w", encoding="utf-8") as file:
+        json.dump(report, file, indent=2)
+
+
+async def _async_generate_profile(hass: HomeAssistant, call: ServiceCall) -> None:
+    """Collect callback timings for the requested window and write a report."""
+    profiler = async_get_profiler(hass)
+    seconds: float = call.data[CONF_SECONDS]
+    profiler.start(call.data[CONF_SLOW_CALLBACK_SECONDS])
+    start_time = int(time.time() * 1000000)
+    persistent_notification.async_create(
+        hass,
+        (
+            "The SwitchBot Cloud profile has started. This notification will be"
+            " updated when it is complete."
+        ),
+        title="SwitchBot Cloud Profile Started",
+        notification_id=f"{DOMAIN}_profile_{start_time}",
+    )
+    try:
+        await sleep(seconds)
+    finally:
+        window = profiler.stop()
+
+    report = {
+        "seconds": seconds,
+        "clock": "thread_time",
+        "slow_callback_seconds": window.slow_callback_seconds,
+        "setup": profiler.setup_durations,
+        "coordinator_dispatch": asdict(window.dispatch),
+        "platforms": {
+            name: asdict(stats) for name, stats in sorted(window.platforms.items())
+        },
+        "entities": {
+            name: asdict(stats)
+            for name, stats in sorted(
+                window.entities.items(), key=lambda item: -item[1].total
+            )
+        },
+    }
+    path = hass.config.path(f"{DOMAIN}.profile.{start_time}.json")
+    await hass.async_add_executor_job(_write_report, path, report)
+    persistent_notification.async_create(
+        hass,
+        f"Wrote SwitchBot Cloud profile report to {path}",
+        title="SwitchBot Cloud Profile Complete",
+        notification_id=f"{DOMAIN}_profile_{start_time}",
+    )
+
+
+@callback
+def async_setup_services(hass: HomeAssistant) -> None:
+    """Register the profile service."""
+
+    async def _async_run_profile(call: ServiceCall) -> None:
+        """Run a profile of the integration's event loop time."""
+        await _async_generate_profile(hass, call)
+
+    async_register_admin_service(
+        hass, DOMAIN, SERVICE_PROFILE, _async_run_profile, schema=PROFILE_SCHEMA
+    )
@@ -0,0 +1,50 @@
+"""Support for SwitchBot Cloud manual scenes."""
+
+from functools import partial
+from typing import Any
+
+from switchbot_api import SwitchBotAPI
+
+from homeassistant.components.scene import Scene
+from homeassistant.config_entries import ConfigEntry
+from homeassistant.core import HomeAssistant
+from homeassistant.helpers.entity_platform import AddEntitiesCallback
+
+from . import SwitchbotCloudData, SwitchbotScene, async_execute_scene
+from .const import DOMAIN
+from .scheduler import ApiScheduler, RequestPriority
+
+
+async def async_setup_entry(
+    hass: HomeAssistant,
+    config: ConfigEntry,
+    async_add_entities: AddEntitiesCallback,
+) -> None:
+    """Set up SwitchBot Cloud entry."""
+    data: SwitchbotCloudData = hass.data[DOMAIN][config.entry_id]
+    async_add_entities(
+        SwitchBotCloudScene(data.api, data.scheduler, scene) for scene in data.scenes
+    )
+
+
+class SwitchBotCloudScene(Scene):
+    """Representation of a SwitchBot Cloud manual scene.
+
+    Activating it runs every action of the scene from a single API request.
+    """
+
+    def __init__(
+        self, api: SwitchBotAPI, scheduler: ApiScheduler, scene: SwitchbotScene
+    ) -> None:
+        """Initialize the scene."""
+        self._api = api
+        self._scheduler = scheduler
+        self._attr_unique_id = scene.scene_id
+        self._attr_name = scene.scene_name
+
+    async def async_activate(self, **kwargs: Any) -> None:
+        """Activate the scene."""
+        await self._scheduler.async_run(
+            RequestPriority.COMMAND,
+            partial(async_execute_scene, self._api, self._attr_unique_id),
+        )
@@ -0,0 +1,188 @@
+"""Prioritized access to the SwitchBot Cloud API."""
+
+from asyncio import CancelledError, Future, get_running_loop
+from collections.abc import Awaitable, Callable
+from enum import IntEnum
+from heapq import heappop, heappush
+from itertools import count
+from logging import getLogger
+import time
+from typing import TYPE_CHECKING, Any, TypeVar
+
+from switchbot_api import CannotConnect
+
+from homeassistant.helpers.storage import Store
+from homeassistant.util import dt as dt_util
+
+from .const import (
+    API_BACKOFF_INITIAL,
+    API_BACKOFF_MAX,
+    API_COMMAND_RESERVE,
+    API_DAILY_QUOTA,
+    API_MAX_CONCURRENT_REQUESTS,
+    QUOTA_SAVE_DELAY,
+)
+
+if TYPE_CHECKING:
+    from datetime import date
+
+_LOGGER = getLogger(__name__)
+
+_T = TypeVar("_T")
+
+
+class RequestPriority(IntEnum):
+    """Priority classes of API requests, lower values are served first."""
+
+    COMMAND = 0
+    POLL = 1
+
+
+class PollShedError(Exception):
+    """Error to indicate a background poll was dropped to preserve quota."""
+
+
+class ApiScheduler:
+    """Grant API request slots by priority and track the daily quota.
+
+    At most a fixed number of requests are in flight at once; when all slots
+    are busy, waiting commands are always granted a slot before waiting polls.
+    Once the remaining quota falls to the reserve kept for commands, polls are
+    shed instead of being sent.
+
+    The library reports rate limiting (HTTP 429) like any other failed request,
+    so every CannotConnect opens a backoff window, doubling on consecutive
+    failures, during which polls are shed while commands are still sent.
+
+    The daily count is persisted so restarts and reloads resume from it. Calls
+    made outside the scheduler, such as the config flow validating the
+    credentials, are not counted.
+    """
+
+    def __init__(
+        self,
+        store: Store[dict[str, Any]] | None = None,
+        max_concurrent: int = API_MAX_CONCURRENT_REQUESTS,
+        daily_quota: int = API_DAILY_QUOTA,
+        command_reserve: int = API_COMMAND_RESERVE,
+    ) -> None:
+        """Initialize the scheduler."""
+        self._store = store
+        self._max_concurrent = max_concurrent
+        self._daily_quota = daily_quota
+        self._command_reserve = command_reserve
+        self._active = 0
+        self._waiters: list[tuple[int, int, Future[None]]] = []
+        self._sequence = count()
+        self._quota_day: date | None = None
+        self._requests_today = 0
+        self._backoff = API_BACKOFF_INITIAL.total_seconds()
+        self._backoff_until = 0.0
+
+    @property
+    def requests_today(self) -> int:
+        """Return the number of requests sent since the quota last reset."""
+        self._roll_quota_day()
+        return self._requests_today
+
+    async def async_load(self) -> None:
+        """Restore the request count persisted for the current quota day."""
+        if self._store is None or (stored := await self._store.async_load()) is None:
+            return
+        if stored.get("day") == dt_util.utcnow().date().isoformat():
+            self._quota_day = dt_util.utcnow().date()
+            self._requests_today = stored.get("requests", 0)
+
+    async def async_save(self) -> None:
+        """Persist the request count now, replacing any pending delayed save."""
+        if self._store is not None:
+            await self._store.async_save(self._data_to_save())
+
+    async def async_run(
+        self, priority: RequestPriority, job: Callable[[], Awaitable[_T]]
+    ) -> _T:
+        """Run an API request once a slot is granted at the given priority."""
+        self._raise_if_shed(priority)
+        await self._acquire(priority)
+        try:
+            # The quota may have been consumed while this request was queued.
+            self._raise_if_shed(priority)
+            self._roll_quota_day()
+            self._requests_today += 1
+            if self._store is not None:
+                self._store.async_delay_save(self._data_to_save, QUOTA_SAVE_DELAY)
+            try:
+                result = await job()
+            except CannotConnect:
+                self._back_off()
+                raise
+            self._backoff = API_BACKOFF_INITIAL.total_seconds()
+            return result
+        finally:
+            self._release()
+
+    def _back_off(self) -> None:
+        """Shed polls for a while after a failed request."""
+        now = time.monotonic()
+        if now < self._backoff_until:
+            # Requests already in flight when the window opened fail together.
+            return
+        _LOGGER.debug("Request failed, shedding polls for %.0fs", self._backoff)
+        self._backoff_until = now + self._backoff
+        self._backoff = min(self._backoff * 2, API_BACKOFF_MAX.total_seconds())
+
+    def _roll_quota_day(self) -> None:
+        """Reset the request count when the quota day changes."""
+        today = dt_util.utcnow().date()
+        if today != self._quota_day:
+            self._quota_day = today
+            self._requests_today = 0
+
+    def _data_to_save(self) -> dict[str, Any]:
+        """Return the request count to persist."""
+        return {
+            "day": self._quota_day.isoformat() if self._quota_day else None,
+            "requests": self._requests_today,
+        }
+
+    def _raise_if_shed(self, priority: RequestPriority) -> None:
+        """Raise PollShedError if a poll would eat into the command reserve.
+
+        Polls are also shed during a backoff window after a failed request.
+        """
+        if priority is not RequestPriority.POLL:
+            return
+        if time.monotonic() < self._backoff_until:
+            _LOGGER.debug("Shedding poll while backing off from failed requests")
+            raise PollShedError
+        if self.requests_today >= self._daily_quota - self._command_reserve:
+            _LOGGER.debug(
+                "Shedding poll, %s of %s daily requests used",
+                self._requests_today,
+                self._daily_quota,
+            )
+            raise PollShedError
+
+    async def _acquire(self, priority: RequestPriority) -> None:
+        """Wait for a request slot."""
+        if self._active < self._max_concurrent and not self._waiters:
+            self._active += 1
+            return
+        future: Future[None] = get_running_loop().create_future()
+        heappush(self._waiters, (priority, next(self._sequence), future))
+        try:
+            await future
+        except CancelledError:
+            if future.done() and not future.cancelled():
+                # The slot was handed over just before the cancellation.
+                self._release()
+            raise
+
+    def _release(self) -> None:
+        """Hand the slot to the most urgent waiter, or free it."""
+        while self._waiters:
+            _, _, future = heappop(self._waiters)
+            if not future.done():
+                future.set_result(None)
+                return
+        self._active -= 1
@@ -1,6 +1,10 @@
 """Platform for sensor integration."""
 
-from switchbot_api import Device, SwitchBotAPI
+from collections.abc import Callable
+from dataclasses import dataclass
+from itertools import chain
+
+from switchbot_api import Device, Remote, SwitchBotAPI
 
 from homeassistant.components.sensor import (
     SensorDeviceClass,
@@ -9,18 +13,35 @@ from homeassistant.components.sensor import (
     SensorStateClass,
 )
 from homeassistant.config_entries import ConfigEntry
-from homeassistant.const import PERCENTAGE, UnitOfTemperature
+from homeassistant.const import (
+    PERCENTAGE,
+    EntityCategory,
+    UnitOfElectricCurrent,
+    UnitOfElectricPotential,
+    UnitOfPower,
+    UnitOfTemperature,
+    UnitOfTime,
+)
 from homeassistant.core import HomeAssistant, callback
+from homeassistant.helpers.device_registry import DeviceEntryType, DeviceInfo
 from homeassistant.helpers.entity_platform import AddEntitiesCallback
+from homeassistant.helpers.typing import StateType
 
 from . import SwitchbotCloudData
-from .const import DOMAIN
+from .aggregate import FleetAggregator
+from .const import DOMAIN, ENTRY_TITLE
 from .coordinator import SwitchBotCoordinator
 from .entity import SwitchBotCloudEntity
 
 SENSOR_TYPE_TEMPERATURE = "temperature"
 SENSOR_TYPE_HUMIDITY = "humidity"
 SENSOR_TYPE_BATTERY = "battery"
+SENSOR_TYPE_VOLTAGE = "voltage"
+SENSOR_TYPE_CURRENT = "electricCurrent"
+SENSOR_TYPE_POWER = "weight"
+SENSOR_TYPE_USAGE_TIME = "electricityOfDay"
+SENSOR_TYPE_ONLINE_STATUS = "onlineStatus"
+SENSOR_TYPE_WATER_BASE_BATTERY = "waterBaseBattery"
 
 METER_PLUS_SENSOR_DESCRIPTIONS = (
     SensorEntityDescription(
@@ -44,6 +65,152 @@ METER_PLUS_SENSOR_DESCRIPTIONS = (
 )
 
 
+# https://github.com/OpenWonderLabs/SwitchBotAPI?tab=readme-ov-file#plug-mini-us-1
+PLUG_MINI_SENSOR_DESCRIPTIONS = (
+    SensorEntityDescription(
+        key=SENSOR_TYPE_VOLTAGE,
+        device_class=SensorDeviceClass.VOLTAGE,
+        state_class=SensorStateClass.MEASUREMENT,
+        native_unit_of_measurement=UnitOfElectricPotential.VOLT,
+    ),
+    SensorEntityDescription(
+        key=SENSOR_TYPE_CURRENT,
+        device_class=SensorDeviceClass.CURRENT,
+        state_class=SensorStateClass.MEASUREMENT,
+        native_unit_of_measurement=UnitOfElectricCurrent.MILLIAMPERE,
+    ),
+    SensorEntityDescription(
+        key=SENSOR_TYPE_POWER,
+        device_class=SensorDeviceClass.POWER,
+        state_class=SensorStateClass.MEASUREMENT,
+        native_unit_of_measurement=UnitOfPower.WATT,
+    ),
+    SensorEntityDescription(
+        key=SENSOR_TYPE_USAGE_TIME,
+        translation_key="usage_time",
+        device_class=SensorDeviceClass.DURATION,
+        state_class=SensorStateClass.TOTAL_INCREASING,
+        native_unit_of_measurement=UnitOfTime.MINUTES,
+    ),
+)
+
+VACUUM_SENSOR_DESCRIPTIONS = (
+    SensorEntityDescription(
+        key=SENSOR_TYPE_BATTERY,
+        device_class=SensorDeviceClass.BATTERY,
+        state_class=SensorStateClass.MEASUREMENT,
+        native_unit_of_measurement=PERCENTAGE,
+        entity_category=EntityCategory.DIAGNOSTIC,
+    ),
+    SensorEntityDescription(
+        key=SENSOR_TYPE_ONLINE_STATUS,
+        translation_key="online_status",
+        device_class=SensorDeviceClass.ENUM,
+        options=["online", "offline"],
+        entity_category=EntityCategory.DIAGNOSTIC,
+    ),
+)
+
+# https://github.com/OpenWonderLabs/SwitchBotAPI?tab=readme-ov-file#robot-vacuum-cleaner-s10-1
+VACUUM_S10_SENSOR_DESCRIPTIONS = (
+    *VACUUM_SENSOR_DESCRIPTIONS,
+    SensorEntityDescription(
+        key=SENSOR_TYPE_WATER_BASE_BATTERY,
+        translation_key="water_base_battery",
+        device_class=SensorDeviceClass.BATTERY,
+        state_class=SensorStateClass.MEASUREMENT,
+        native_unit_of_measurement=PERCENTAGE,
+        entity_category=EntityCategory.DIAGNOSTIC,
+    ),
+)
+
+SENSOR_DESCRIPTIONS_BY_DEVICE_TYPES: dict[
+    str, tuple[SensorEntityDescription, ...]
+] = {
+    "Meter": METER_PLUS_SENSOR_DESCRIPTIONS,
+    "MeterPlus": METER_PLUS_SENSOR_DESCRIPTIONS,
+    "WoIOSensor": METER_PLUS_SENSOR_DESCRIPTIONS,
+    "Plug Mini (US)": PLUG_MINI_SENSOR_DESCRIPTIONS,
+    "Plug Mini (JP)": PLUG_MINI_SENSOR_DESCRIPTIONS,
+    "Robot Vacuum Cleaner S10": VACUUM_S10_SENSOR_DESCRIPTIONS,
+    "K10+": VACUUM_SENSOR_DESCRIPTIONS,
+    "K10+ Pro": VACUUM_SENSOR_DESCRIPTIONS,
+    "Robot Vacuum Cleaner S1": VACUUM_SENSOR_DESCRIPTIONS,
+    "Robot Vacuum Cleaner S1 Plus": VACUUM_SENSOR_DESCRIPTIONS,
+}
+
+
+@dataclass(frozen=True, kw_only=True)
+class SwitchBotCloudFleetSensorEntityDescription(SensorEntityDescription):
+    """Describes a sensor aggregated over every device of a config entry."""
+
+    value_fn: Callable[[FleetAggregator], StateType]
+
+
+FLEET_SENSOR_DESCRIPTIONS = (
+    SwitchBotCloudFleetSensorEntityDescription(
+        key=f"{SENSOR_TYPE_TEMPERATURE}_min",
+        translation_key="fleet_temperature_min",
+        device_class=SensorDeviceClass.TEMPERATURE,
+        state_class=SensorStateClass.MEASUREMENT,
+        native_unit_of_measurement=UnitOfTemperature.CELSIUS,
+        value_fn=lambda fleet: fleet.statistic(SENSOR_TYPE_TEMPERATURE).minimum,
+    ),
+    SwitchBotCloudFleetSensorEntityDescription(
+        key=f"{SENSOR_TYPE_TEMPERATURE}_max",
+        translation_key="fleet_temperature_max",
+        device_class=SensorDeviceClass.TEMPERATURE,
+        state_class=SensorStateClass.MEASUREMENT,
+        native_unit_of_measurement=UnitOfTemperature.CELSIUS,
+        value_fn=lambda fleet: fleet.statistic(SENSOR_TYPE_TEMPERATURE).maximum,
+    ),
+    SwitchBotCloudFleetSensorEntityDescription(
+        key=f"{SENSOR_TYPE_TEMPERATURE}_mean",
+        translation_key="fleet_temperature_mean",
+        device_class=SensorDeviceClass.TEMPERATURE,
+        state_class=SensorStateClass.MEASUREMENT,
+        native_unit_of_measurement=UnitOfTemperature.CELSIUS,
+        value_fn=lambda fleet: fleet.statistic(SENSOR_TYPE_TEMPERATURE).mean,
+    ),
+    SwitchBotCloudFleetSensorEntityDescription(
+        key=f"{SENSOR_TYPE_HUMIDITY}_min",
+        translation_key="fleet_humidity_min",
+        device_class=SensorDeviceClass.HUMIDITY,
+        state_class=SensorStateClass.MEASUREMENT,
+        native_unit_of_measurement=PERCENTAGE,
+        value_fn=lambda fleet: fleet.statistic(SENSOR_TYPE_HUMIDITY).minimum,
+    ),
+    SwitchBotCloudFleetSensorEntityDescription(
+        key=f"{SENSOR_TYPE_HUMIDITY}_max",
+        translation_key="fleet_humidity_max",
+        device_class=SensorDeviceClass.HUMIDITY,
+        state_class=SensorStateClass.MEASUREMENT,
+        native_unit_of_measurement=PERCENTAGE,
+        value_fn=lambda fleet: fleet.statistic(SENSOR_TYPE_HUMIDITY).maximum,
+    ),
+    SwitchBotCloudFleetSensorEntityDescription(
+        key=f"{SENSOR_TYPE_HUMIDITY}_mean",
+        translation_key="fleet_humidity_mean",
+        device_class=SensorDeviceClass.HUMIDITY,
+        state_class=SensorStateClass.MEASUREMENT,
+        native_unit_of_measurement=PERCENTAGE,
+        value_fn=lambda fleet: fleet.statistic(SENSOR_TYPE_HUMIDITY).mean,
+    ),
+    SwitchBotCloudFleetSensorEntityDescription(
+        key="low_battery_count",
+        translation_key="fleet_low_battery_count",
+        state_class=SensorStateClass.MEASUREMENT,
+        value_fn=lambda fleet: fleet.low_battery_count,
+    ),
+    SwitchBotCloudFleetSensorEntityDescription(
+        key="offline_count",
+        translation_key="fleet_offline_count",
+        state_class=SensorStateClass.MEASUREMENT,
+        value_fn=lambda fleet: fleet.offline_count,
+    ),
+)
+
+
 async def async_setup_entry(
     hass: HomeAssistant,
     config: ConfigEntry,
@@ -55,7 +222,26 @@ async def async_setup_entry(
     async_add_entities(
         SwitchBotCloudSensor(data.api, device, coordinator, description)
         for device, coordinator in data.devices.sensors
-        for description in METER_PLUS_SENSOR_DESCRIPTIONS
+        for description in SENSOR_DESCRIPTIONS_BY_DEVICE_TYPES.get(
+            device.device_type, ()
+        )
+    )
+
+    fleet = FleetAggregator(
+        description.key for description in METER_PLUS_SENSOR_DESCRIPTIONS
+    )
+    tracked_device_ids: set[str] = set()
+    for device, coordinator in chain(
+        data.devices.switches, data.devices.sensors, data.devices.vacuums
+    ):
+        if isinstance(device, Remote) or device.device_id in tracked_device_ids:
+            continue
+        tracked_device_ids.add(device.device_id)
+        config.async_on_unload(fleet.async_track(device.device_id, coordinator))
+
+    async_add_entities(
+        SwitchBotCloudFleetSensor(config.entry_id, fleet, description)
+        for description in FLEET_SENSOR_DESCRIPTIONS
     )
 
 
@@ -77,7 +263,48 @@ class SwitchBotCloudSensor(SwitchBotCloudEntity, SensorEntity):
     @callback
     def _handle_coordinator_update(self) -> None:
         """Handle updated data from the coordinator."""
-        if not self.coordinator.data:
+        if self.coordinator.data:
+            self._attr_native_value = self.coordinator.data.get(
+                self.entity_description.key
+            )
+        self.async_write_ha_state()
+
+
+class SwitchBotCloudFleetSensor(SensorEntity):
+    """Representation of a sensor aggregated over every SwitchBot Cloud device."""
+
+    entity_description: SwitchBotCloudFleetSensorEntityDescription
+    _attr_has_entity_name = True
+    _attr_should_poll = False
+
+    def __init__(
+        self,
+        entry_id: str,
+        fleet: FleetAggregator,
+        description: SwitchBotCloudFleetSensorEntityDescription,
+    ) -> None:
+        """Initialize SwitchBot Cloud fleet sensor entity."""
+        self.entity_description = description
+        self._fleet = fleet
+        self._attr_unique_id = f"{entry_id}_fleet_{description.key}"
+        self._attr_device_info = DeviceInfo(
+            identifiers={(DOMAIN, entry_id)},
+            name=ENTRY_TITLE,
+            manufacturer="SwitchBot",
+            entry_type=DeviceEntryType.SERVICE,
+        )
+        self._attr_native_value = description.value_fn(fleet)
+
+    async def async_added_to_hass(self) -> None:
+        """Subscribe to fleet updates."""
+        await super().async_added_to_hass()
+        self.async_on_remove(self._fleet.async_add_listener(self._handle_fleet_update))
+
+    @callback
+    def _handle_fleet_update(self) -> None:
+        """Handle an updated aggregate, writing state only when it changed."""
+        value = self.entity_description.value_fn(self._fleet)
+        if value == self._attr_native_value:
             return
-        self._attr_native_value = self.coordinator.data.get(self.entity_description.key)
+        self._attr_native_value = value
         self.async_write_ha_state()
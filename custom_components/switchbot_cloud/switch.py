@@ -49,9 +49,8 @@ class SwitchBotCloudSwitch(SwitchBotCloudEntity, SwitchEntity):
     @callback
     def _handle_coordinator_update(self) -> None:
         """Handle updated data from the coordinator."""
-        if not self.coordinator.data:
-            return
-        self._attr_is_on = self.coordinator.data.get("power") == PowerState.ON.value
+        if self.coordinator.data:
+            self._attr_is_on = self.coordinator.data.get("power") == PowerState.ON.value
         self.async_write_ha_state()
 
 
@@ -60,7 +59,11 @@ class SwitchBotCloudRemoteSwitch(SwitchBotCloudSwitch):
 
     @callback
     def _handle_coordinator_update(self) -> None:
-        """Handle updated data from the coordinator."""
+        """Handle updated data from the coordinator.
+
+        Remotes have no state, only their availability can change.
+        """
+        self.async_write_ha_state()
 
 
 class SwitchBotCloudPlugSwitch(SwitchBotCloudSwitch):
@@ -101,6 +101,8 @@ class SwitchBotCloudVacuum(SwitchBotCloudEntity, StateVacuumEntity):
         VACUUM_FAN_SPEED_TO_SWITCHBOT_FAN_SPEED.keys(),
     )
 
+    _water_base_battery: int | None = None
+
     @property
     def extra_state_attributes(self) -> dict[str, Any]:
         """Return the state attributes of the vacuum cleaner."""
@@ -109,6 +111,8 @@ class SwitchBotCloudVacuum(SwitchBotCloudEntity, StateVacuumEntity):
         if self._water_base_battery is not None:
             data[ATTR_WATER_BASE_BATTERY] = self._water_base_battery
 
+        return data
+
     async def async_set_fan_speed(self, fan_speed: str, **kwargs: Any) -> None:
         """Set fan speed."""
         self._attr_fan_speed = fan_speed
@@ -163,14 +167,13 @@ class SwitchBotCloudVacuum(SwitchBotCloudEntity, StateVacuumEntity):
     @callback
     def _handle_coordinator_update(self) -> None:
         """Handle updated data from the coordinator."""
-        if not self.coordinator.data:
-            return
-
-        self._attr_battery_level = self.coordinator.data.get("battery")
-        self._attr_available = self.coordinator.data.get("onlineStatus") == "online"
+        if data := self.coordinator.data:
+            self._attr_battery_level = data.get("battery")
+            self._water_base_battery = data.get("waterBaseBattery")
+            self._attr_available = data.get("onlineStatus") == "online"
 
-        switchbot_state = str(self.coordinator.data.get("workingStatus"))
-        self._attr_state = VACUUM_SWITCHBOT_STATE_TO_HA_STATE.get(switchbot_state)
+            switchbot_state = str(data.get("workingStatus"))
+            self._attr_state = VACUUM_SWITCHBOT_STATE_TO_HA_STATE.get(switchbot_state)
 
         self.async_write_ha_state()
 